@@ -2,17 +2,8 @@
 
 """SONiC Manager - Standalone SONiC configuration management package."""
 
-from .sonic import (
-    generate_sonic_config,
-    save_config_to_netbox,
-    export_config_to_file,
-    sync_sonic,
-    get_connected_interfaces,
-    get_connected_device_for_sonic_interface,
-    get_connected_device_via_interface,
-    find_interconnected_devices,
-    get_device_bgp_neighbors_via_loopback,
-)
+import importlib
+from typing import Any
 
 __version__ = "0.1.0"
 
@@ -27,3 +18,14 @@ __all__ = [
     "find_interconnected_devices",
     "get_device_bgp_neighbors_via_loopback",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the public API from the sonic package on first access.
+
+    Keeps ``import sonic_manager`` (and thereby the CLI entry point) free of
+    the NetBox and Redis import chains until they are actually needed.
+    """
+    if name in __all__:
+        return getattr(importlib.import_module(".sonic", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
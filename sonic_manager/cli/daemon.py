@@ -0,0 +1,216 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Persistent daemon mode for the SONiC Manager CLI.
+
+The daemon keeps one process with its NetBox session, Redis connection and
+caches warm and runs forwarded commands on it. Requests and replies are
+exchanged as a single line of JSON each over a Unix socket.
+
+The daemon reads its configuration from its own environment once. A request
+therefore carries a fingerprint of the client's configuration environment
+(see CONFIG_ENVIRONMENT_VARIABLES), and the daemon rejects commands whose
+fingerprint differs from its own, so that they are run locally instead.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+from typing import Any, Dict, List, Optional
+
+import click
+from loguru import logger
+
+from ..core.config import CONFIG_ENVIRONMENT_VARIABLES
+
+
+def environment_fingerprint() -> str:
+    """Get a fingerprint of the environment variables that configure commands.
+
+    Returns:
+        Hex digest over the values of CONFIG_ENVIRONMENT_VARIABLES
+    """
+    environment = {name: os.environ.get(name) for name in CONFIG_ENVIRONMENT_VARIABLES}
+    return hashlib.sha256(json.dumps(environment, sort_keys=True).encode()).hexdigest()
+
+
+def _run_command(argv: List[str], cwd: Optional[str], log_level: str) -> Dict[str, Any]:
+    """Run a CLI command in this process and capture its output.
+
+    Args:
+        argv: Command line arguments without the program name
+        cwd: Working directory of the client, used to resolve relative paths
+        log_level: Log level of the daemon, restored after the command
+
+    Returns:
+        Dictionary with the captured stdout, stderr and exit code
+    """
+    from .main import cli
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    rc = 0
+    previous_cwd = os.getcwd()
+
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                rc = cli.main(
+                    args=argv, prog_name="sonic-manager", standalone_mode=False
+                )
+            except click.exceptions.Exit as e:
+                rc = e.exit_code
+            except click.ClickException as e:
+                e.show()
+                rc = e.exit_code
+            except click.Abort:
+                click.echo("Aborted!", err=True)
+                rc = 1
+            except SystemExit as e:
+                rc = e.code if isinstance(e.code, int) else 1
+    finally:
+        os.chdir(previous_cwd)
+        # The cli group binds its log sink to the redirected stderr
+        logger.remove()
+        logger.add(sys.stderr, level=log_level)
+
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "rc": rc or 0,
+    }
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server handling forwarded commands one at a time."""
+
+    def __init__(self, socket_path: str, log_level: str) -> None:
+        self.log_level = log_level
+        self.fingerprint = environment_fingerprint()
+
+        # Create the socket accessible to the owner only
+        umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _CommandHandler)
+        finally:
+            os.umask(umask)
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """Handle a single forwarded command."""
+
+    server: _DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # Connection probe without a command
+            return
+
+        try:
+            request = json.loads(line)
+            if request.get("fingerprint") != self.server.fingerprint:
+                reply: Dict[str, Any] = {"rejected": "environment differs"}
+            else:
+                reply = _run_command(
+                    request["argv"], request.get("cwd"), self.server.log_level
+                )
+        except Exception as e:
+            logger.error(f"Failed to handle forwarded command: {e}")
+            reply = {"stdout": "", "stderr": f"{e}\n", "rc": 1}
+
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+def _is_listening(socket_path: str) -> bool:
+    """Check whether a daemon accepts connections on the socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+
+def create_server(socket_path: str, log_level: str = "INFO") -> _DaemonServer:
+    """Create the daemon's Unix socket server.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+        log_level: Log level restored after each forwarded command
+
+    Returns:
+        Server bound to the socket, not yet serving
+    """
+    if os.path.exists(socket_path):
+        if _is_listening(socket_path):
+            raise click.ClickException(
+                f"Another daemon is already listening on {socket_path}"
+            )
+        # Remove the stale socket of a daemon that did not shut down cleanly
+        os.unlink(socket_path)
+
+    return _DaemonServer(socket_path, log_level)
+
+
+def serve(socket_path: str, log_level: str = "INFO") -> None:
+    """Serve forwarded CLI commands on a Unix socket until interrupted.
+
+    Commands are handled one at a time, as the sync caches are shared by
+    the whole process.
+
+    Args:
+        socket_path: Path of the Unix socket to listen on
+        log_level: Log level restored after each forwarded command
+    """
+    with create_server(socket_path, log_level) as server:
+        logger.info(f"Listening for commands on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(socket_path)
+
+
+def forward_command(argv: List[str], socket_path: str) -> Optional[Dict[str, Any]]:
+    """Forward a CLI command to a running daemon.
+
+    Args:
+        argv: Command line arguments without the program name
+        socket_path: Path of the daemon's Unix socket
+
+    Returns:
+        Dictionary with the command's stdout, stderr and exit code, or None
+        if no daemon is reachable or it rejected the command because its
+        configuration environment differs
+    """
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "fingerprint": environment_fingerprint(),
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+
+    reply: Dict[str, Any] = json.loads(line)
+    if "rejected" in reply:
+        return None
+
+    return reply
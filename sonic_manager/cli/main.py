@@ -3,14 +3,30 @@
 """CLI interface for SONiC Manager."""
 
 import click
+import os
 import sys
+from typing import Optional
 from loguru import logger
 
-from ..sonic.sync import sync_sonic
-from ..core.config import config
+# Top-level help, printed without building the click parser. Keep in sync
+# with the commands below.
+USAGE = """Usage: sonic-manager [OPTIONS] COMMAND [ARGS]...
 
+  SONiC Manager - Standalone SONiC configuration management.
 
-@click.group()
+Options:
+  --debug     Enable debug logging
+  -h, --help  Show this message and exit.
+
+Commands:
+  config-info  Show current configuration.
+  daemon       Run commands forwarded over a Unix socket.
+  export       Export SONiC configurations to files.
+  sync         Sync SONiC configurations for eligible devices.
+"""
+
+
+@click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option("--debug", is_flag=True, help="Enable debug logging")
 def cli(debug):
     """SONiC Manager - Standalone SONiC configuration management."""
@@ -28,6 +44,8 @@ def cli(debug):
 def sync(device, no_diff):
     """Sync SONiC configurations for eligible devices."""
     try:
+        from ..sonic.sync import sync_sonic
+
         show_diff = not no_diff
         result = sync_sonic(device_name=device, show_diff=show_diff)
 
@@ -50,16 +68,10 @@ def sync(device, no_diff):
 def export(output_dir, device):
     """Export SONiC configurations to files."""
     try:
-        if output_dir:
-            # Temporarily override export directory
-            original_dir = config.SONIC_EXPORT_DIR
-            config.SONIC_EXPORT_DIR = output_dir
+        from ..sonic.sync import sync_sonic
+        from ..core.config import config
 
-        result = sync_sonic(device_name=device, show_diff=False)
-
-        if output_dir:
-            # Restore original directory
-            config.SONIC_EXPORT_DIR = original_dir
+        result = sync_sonic(device_name=device, show_diff=False, export_dir=output_dir)
 
         if result:
             click.echo(f"Successfully exported {len(result)} device(s)")
@@ -76,6 +88,8 @@ def export(output_dir, device):
 @cli.command()
 def config_info():
     """Show current configuration."""
+    from ..core.config import config
+
     click.echo("SONiC Manager Configuration:")
     click.echo(f"  NetBox URL: {config.NETBOX_URL}")
     click.echo(f"  NetBox Token: {'***' if config.NETBOX_TOKEN else 'Not set'}")
@@ -86,8 +100,45 @@ def config_info():
     click.echo(f"  Export Identifier: {config.SONIC_EXPORT_IDENTIFIER}")
 
 
+@cli.command()
+@click.option("--socket", "socket_path", help="Path of the Unix socket to listen on")
+@click.pass_context
+def daemon(ctx: click.Context, socket_path: Optional[str]) -> None:
+    """Run commands forwarded over a Unix socket.
+
+    While the daemon is running, other sonic-manager invocations forward
+    their command to it instead of starting up themselves. A command is
+    only forwarded if the client's NetBox, Redis and export environment
+    variables match the daemon's; otherwise it runs locally.
+    """
+    from ..core.config import config
+    from .daemon import serve
+
+    log_level = "DEBUG" if ctx.find_root().params["debug"] else "INFO"
+    serve(socket_path or config.SONIC_MANAGER_SOCKET, log_level)
+
+
 def main():
     """Entry point for the CLI."""
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        click.echo(USAGE, nl=False)
+        sys.exit(0)
+
+    command = next((arg for arg in sys.argv[1:] if not arg.startswith("-")), None)
+    if command != "daemon":
+        from ..core.config import config
+
+        # Forward the command to a running daemon, if there is one and it
+        # was started with the same configuration environment
+        if config.SONIC_MANAGER_DAEMON or os.path.exists(config.SONIC_MANAGER_SOCKET):
+            from .daemon import forward_command
+
+            reply = forward_command(sys.argv[1:], config.SONIC_MANAGER_SOCKET)
+            if reply is not None:
+                sys.stdout.write(reply["stdout"])
+                sys.stderr.write(reply["stderr"])
+                sys.exit(reply["rc"])
+
     cli()
 
 
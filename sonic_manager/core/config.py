@@ -3,6 +3,7 @@
 """Configuration management for SONiC Manager."""
 
 import os
+from functools import cached_property
 from typing import Optional
 
 
@@ -15,40 +16,94 @@ def read_secret(secret_name: str) -> str:
         return ""
 
 
+# Environment variables that configure commands, see Config
+CONFIG_ENVIRONMENT_VARIABLES = (
+    "REDIS_HOST",
+    "REDIS_PORT",
+    "REDIS_DB",
+    "NETBOX_API",
+    "NETBOX_URL",
+    "NETBOX_TOKEN",
+    "IGNORE_SSL_ERRORS",
+    "NETBOX_FILTER_CONDUCTOR_SONIC",
+    "SONIC_EXPORT_DIR",
+    "SONIC_EXPORT_PREFIX",
+    "SONIC_EXPORT_SUFFIX",
+    "SONIC_EXPORT_IDENTIFIER",
+    "OSISM_API_URL",
+)
+
+
 class Config:
-    """Configuration class for SONiC Manager."""
+    """Configuration class for SONiC Manager.
 
-    def __init__(self):
-        # Redis configuration
-        self.REDIS_HOST: str = os.getenv("REDIS_HOST", "redis")
-        self.REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
-        self.REDIS_DB: int = int(os.getenv("REDIS_DB", "0"))
+    Settings are read from the environment on first access and cached.
+    """
 
-        # NetBox configuration
-        self.NETBOX_URL: Optional[str] = os.getenv(
-            "NETBOX_API", os.getenv("NETBOX_URL")
-        )
-        self.NETBOX_TOKEN: Optional[str] = os.getenv(
-            "NETBOX_TOKEN", read_secret("NETBOX_TOKEN")
-        )
-        self.IGNORE_SSL_ERRORS: bool = os.getenv("IGNORE_SSL_ERRORS", "True") == "True"
+    # Redis configuration
+    @cached_property
+    def REDIS_HOST(self) -> str:
+        return os.getenv("REDIS_HOST", "redis")
+
+    @cached_property
+    def REDIS_PORT(self) -> int:
+        return int(os.getenv("REDIS_PORT", "6379"))
+
+    @cached_property
+    def REDIS_DB(self) -> int:
+        return int(os.getenv("REDIS_DB", "0"))
+
+    # NetBox configuration
+    @cached_property
+    def NETBOX_URL(self) -> Optional[str]:
+        return os.getenv("NETBOX_API") or os.getenv("NETBOX_URL")
+
+    @cached_property
+    def NETBOX_TOKEN(self) -> Optional[str]:
+        return os.getenv("NETBOX_TOKEN") or read_secret("NETBOX_TOKEN")
 
-        # SONiC specific configuration
-        self.NETBOX_FILTER_CONDUCTOR_SONIC: str = os.getenv(
+    @cached_property
+    def IGNORE_SSL_ERRORS(self) -> bool:
+        return os.getenv("IGNORE_SSL_ERRORS", "True") == "True"
+
+    # SONiC specific configuration
+    @cached_property
+    def NETBOX_FILTER_CONDUCTOR_SONIC(self) -> str:
+        return os.getenv(
             "NETBOX_FILTER_CONDUCTOR_SONIC",
             "[{'state': 'active', 'tag': ['managed-by-metalbox']}]",
         )
 
-        # SONiC export configuration
-        self.SONIC_EXPORT_DIR: str = os.getenv("SONIC_EXPORT_DIR", "/etc/sonic/export")
-        self.SONIC_EXPORT_PREFIX: str = os.getenv("SONIC_EXPORT_PREFIX", "osism_")
-        self.SONIC_EXPORT_SUFFIX: str = os.getenv("SONIC_EXPORT_SUFFIX", ".json")
-        self.SONIC_EXPORT_IDENTIFIER: str = os.getenv(
-            "SONIC_EXPORT_IDENTIFIER", "hostname"
-        )
+    # SONiC export configuration
+    @cached_property
+    def SONIC_EXPORT_DIR(self) -> str:
+        return os.getenv("SONIC_EXPORT_DIR", "/etc/sonic/export")
+
+    @cached_property
+    def SONIC_EXPORT_PREFIX(self) -> str:
+        return os.getenv("SONIC_EXPORT_PREFIX", "osism_")
+
+    @cached_property
+    def SONIC_EXPORT_SUFFIX(self) -> str:
+        return os.getenv("SONIC_EXPORT_SUFFIX", ".json")
+
+    @cached_property
+    def SONIC_EXPORT_IDENTIFIER(self) -> str:
+        return os.getenv("SONIC_EXPORT_IDENTIFIER", "hostname")
+
+    # Daemon configuration
+    @cached_property
+    def SONIC_MANAGER_SOCKET(self) -> str:
+        return os.getenv("SONIC_MANAGER_SOCKET", "/run/sonic-manager.sock")
+
+    @cached_property
+    def SONIC_MANAGER_DAEMON(self) -> bool:
+        return os.getenv("SONIC_MANAGER_DAEMON", "False") in ("True", "1")
 
-        # API configuration
-        self.OSISM_API_URL: Optional[str] = os.getenv("OSISM_API_URL", None)
+    # API configuration
+    @cached_property
+    def OSISM_API_URL(self) -> Optional[str]:
+        return os.getenv("OSISM_API_URL", None)
 
 
 # Global configuration instance
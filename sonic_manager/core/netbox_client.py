@@ -2,39 +2,127 @@
 
 """NetBox client for SONiC Manager."""
 
+import functools
+import ipaddress
+import threading
 import time
-from typing import Optional, Any, Dict, List
-import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Tuple
 import urllib3
 import pynetbox
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 from redis import Redis
 
+try:
+    import orjson
+except ImportError:
+    import json as orjson  # type: ignore[no-redef]
+
 from .config import config
 
+# Maximum number of concurrent NetBox requests
+NETBOX_MAX_WORKERS = 16
+
+# Maximum number of IDs passed to a single NetBox filter request
+NETBOX_FILTER_CHUNK_SIZE = 100
+
+# Interface fields requested from NetBox when only VLAN assignments are needed
+INTERFACE_VLAN_FIELDS = "id,url,untagged_vlan,tagged_vlans"
+
+# GraphQL query for the VLANs assigned to the interfaces of a device
+DEVICE_VLANS_QUERY = """
+query ($device_id: ID!) {
+  interface_list(filters: {device_id: $device_id}) {
+    untagged_vlan { id vid name }
+    tagged_vlans { id vid name }
+  }
+}
+"""
+
+# Seconds to wait before retrying a failed Redis connection
+REDIS_RECONNECT_INTERVAL = 30
+
+# Task output lines buffered before the Redis pipeline is flushed
+TASK_OUTPUT_BUFFER_SIZE = 32
+# Age in seconds of the oldest buffered line at which the next push flushes
+TASK_OUTPUT_FLUSH_INTERVAL = 0.01
+# Maximum number of task output messages read from Redis per request
+TASK_OUTPUT_READ_COUNT = 100
+
 
+_warnings_disabled = False
+
+
+def _disable_warnings_once() -> None:
+    """Disable urllib3 warnings, only touching the warning filters once."""
+    global _warnings_disabled
+    if not _warnings_disabled:
+        urllib3.disable_warnings()
+        _warnings_disabled = True
+
+
+@functools.lru_cache(maxsize=4)
 def get_netbox_connection(
     netbox_url: Optional[str],
     netbox_token: Optional[str],
     ignore_ssl_errors: bool = False,
 ) -> Optional[pynetbox.api]:
-    """Create NetBox API connection."""
+    """Create NetBox API connection.
+
+    Connections are cached, so identical arguments share one HTTP session
+    and its connection pool.
+    """
     if netbox_url and netbox_token:
         nb = pynetbox.api(netbox_url, token=netbox_token)
 
         if ignore_ssl_errors and nb:
-            import requests
-
-            urllib3.disable_warnings()
+            _disable_warnings_once()
             session = requests.Session()
             session.verify = False
             nb.http_session = session
 
+        # Keep enough pooled connections for concurrent requests and retry
+        # transient connection errors
+        adapter = HTTPAdapter(
+            pool_connections=NETBOX_MAX_WORKERS,
+            pool_maxsize=NETBOX_MAX_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.1),
+        )
+        nb.http_session.mount("http://", adapter)
+        nb.http_session.mount("https://", adapter)
+
         return nb
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_device_query_list(value: str) -> Tuple[Dict[str, Any], ...]:
+    """Parse a NetBox device filter list, cached per distinct value."""
+    try:
+        return tuple(orjson.loads(value))
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Error parsing NETBOX_FILTER_CONDUCTOR_SONIC: {e}")
+        return ({"state": "active", "tag": ["managed-by-metalbox"]},)
+
+
+class GraphQLQueryError(Exception):
+    """NetBox returned errors for a GraphQL query."""
+
+
+def _is_rejected_graphql_query(error: Exception) -> bool:
+    """Check whether NetBox rejected a GraphQL query itself."""
+    if isinstance(error, GraphQLQueryError):
+        return True
+    return isinstance(error, pynetbox.RequestError) and error.req.status_code in (
+        400,
+        404,
+    )
+
+
 class NetBoxClient:
     """NetBox client wrapper."""
 
@@ -42,40 +130,75 @@ class NetBoxClient:
         self.nb = get_netbox_connection(
             config.NETBOX_URL, config.NETBOX_TOKEN, config.IGNORE_SSL_ERRORS
         )
+        # Disabled once NetBox rejects the GraphQL query, e.g. on older releases
+        self._graphql_vlans_supported = True
+
+        # Buffered task output, flushed to Redis through a pipeline
+        self._task_output_lock = threading.Lock()
+        self._task_output_pipe = None
+        self._task_output_pending = 0
+        self._task_output_started = 0.0
 
         # Redis client for task management
+        self.redis = None
+        self._redis_lock = threading.Lock()
+        self._redis_connect_attempt = 0.0
+        self._connect_redis()
+
+    def _connect_redis(self) -> None:
+        """Connect to Redis, leaving the client unset if it is unreachable."""
+        self._redis_connect_attempt = time.monotonic()
         try:
-            self.redis = Redis(
+            redis = Redis(
                 host=config.REDIS_HOST,
                 port=config.REDIS_PORT,
                 db=config.REDIS_DB,
                 socket_keepalive=True,
+                socket_connect_timeout=5,
+                decode_responses=True,
             )
-            self.redis.ping()
+            redis.ping()
         except Exception as e:
             logger.warning(f"Redis connection failed: {e}")
-            self.redis = None
+            return
+
+        self._task_output_pipe = redis.pipeline(transaction=False)
+        self.redis = redis
+
+    def _redis_available(self) -> bool:
+        """Check for a Redis connection, retrying a failed one periodically."""
+        if self.redis is None:
+            with self._redis_lock:
+                if (
+                    self.redis is None
+                    and time.monotonic() - self._redis_connect_attempt
+                    >= REDIS_RECONNECT_INTERVAL
+                ):
+                    self._connect_redis()
+        return self.redis is not None
 
     def get_nb_device_query_list_sonic(self) -> List[Dict[str, Any]]:
         """Get NetBox device query list for SONiC devices."""
-        try:
-            return json.loads(config.NETBOX_FILTER_CONDUCTOR_SONIC)
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing NETBOX_FILTER_CONDUCTOR_SONIC: {e}")
-            return [{"state": "active", "tag": ["managed-by-metalbox"]}]
+        return list(_parse_device_query_list(config.NETBOX_FILTER_CONDUCTOR_SONIC))
 
-    def get_device_loopbacks(self, device: Any) -> List[Any]:
-        """Get loopback interfaces for a device."""
+    def get_device_loopbacks(self, device: Any, limit: int = 0) -> Iterator[Any]:
+        """Get loopback interfaces for a device.
+
+        The interfaces are fetched page by page while iterating, so callers
+        that stop early avoid fetching the remaining pages. Use `limit` to
+        set the page size, e.g. ``limit=1`` when only the first is needed.
+        """
         if not self.nb:
-            return []
+            return
 
         try:
-            return list(
-                self.nb.dcim.interfaces.filter(device_id=device.id, name__ic="loopback")
+            # Brief representations are sufficient to identify the loopbacks,
+            # pynetbox fetches the full record if more attributes are accessed
+            yield from self.nb.dcim.interfaces.filter(
+                device_id=device.id, name__ic="loopback", brief=True, limit=limit
             )
         except Exception as e:
             logger.error(f"Error getting loopbacks for device {device.name}: {e}")
-            return []
 
     def get_device_oob_ip(self, device: Any) -> Optional[str]:
         """Get out-of-band IP address for a device."""
@@ -83,13 +206,22 @@ class NetBoxClient:
             return None
 
         try:
-            # Look for management interface IP
-            interfaces = self.nb.dcim.interfaces.filter(
-                device_id=device.id, mgmt_only=True
-            )
-            for interface in interfaces:
+            # Prefer the OOB IP assigned on the device itself
+            oob_ip = getattr(device, "oob_ip", None)
+            if oob_ip and ipaddress.ip_interface(str(oob_ip.address)).version == 4:
+                return str(oob_ip.address).split("/")[0]
+
+            # Fall back to the IPv4 addresses of the management interfaces,
+            # fetched in a single request for all of them
+            interface_ids = [
+                interface.id
+                for interface in self.nb.dcim.interfaces.filter(
+                    device_id=device.id, mgmt_only=True, brief=True
+                )
+            ]
+            if interface_ids:
                 ip_addresses = self.nb.ipam.ip_addresses.filter(
-                    assigned_object_id=interface.id
+                    interface_id=interface_ids, family=4
                 )
                 for ip in ip_addresses:
                     return str(ip.address).split("/")[0]
@@ -98,41 +230,196 @@ class NetBoxClient:
 
         return None
 
+    def _query_graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a GraphQL query against NetBox and return its data."""
+        # The GraphQL API lives next to, not below, the REST API
+        base_url = self.nb.base_url
+        if base_url.endswith("/api"):
+            base_url = base_url[: -len("/api")]
+
+        request = pynetbox.core.query.Request(
+            base=f"{base_url}/graphql/",
+            http_session=self.nb.http_session,
+            token=self.nb.token,
+        )
+        response = request.post({"query": query, "variables": variables})
+        if response.get("errors"):
+            raise GraphQLQueryError(f"GraphQL query failed: {response['errors']}")
+        data: Dict[str, Any] = response["data"]
+        return data
+
     def get_device_vlans(self, device: Any) -> List[Any]:
-        """Get VLANs associated with a device."""
+        """Get VLANs associated with a device.
+
+        Uses a single GraphQL query when NetBox supports it. The returned
+        records then only carry id, vid and name, further attributes are
+        fetched by pynetbox on access. Falls back to the REST API if the query
+        fails; if NetBox rejects the query itself, GraphQL is not tried again.
+        """
         if not self.nb:
             return []
 
-        try:
-            # Get interfaces for the device
-            interfaces = self.nb.dcim.interfaces.filter(device_id=device.id)
-            vlans = []
-
-            for interface in interfaces:
-                if interface.untagged_vlan:
-                    vlans.append(interface.untagged_vlan)
-                if interface.tagged_vlans:
-                    vlans.extend(interface.tagged_vlans)
+        if self._graphql_vlans_supported:
+            try:
+                return self._get_device_vlans_graphql(device)
+            except Exception as e:
+                if _is_rejected_graphql_query(e):
+                    # NetBox will keep rejecting the query, stop trying it
+                    logger.warning(
+                        f"NetBox rejected the device VLAN GraphQL query, using the REST API from now on: {e}"
+                    )
+                    self._graphql_vlans_supported = False
+                else:
+                    # Transport errors only affect this request
+                    logger.debug(
+                        f"GraphQL query for VLANs of device {device.name} failed, using the REST API: {e}"
+                    )
 
-            return list(set(vlans))  # Remove duplicates
+        try:
+            return self._get_device_vlans_rest(device)
         except Exception as e:
             logger.error(f"Error getting VLANs for device {device.name}: {e}")
             return []
 
+    def _get_device_vlans_graphql(self, device: Any) -> List[Any]:
+        """Get VLANs associated with a device with one GraphQL query."""
+        data = self._query_graphql(DEVICE_VLANS_QUERY, {"device_id": device.id})
+
+        vlans = {}
+        for interface in data["interface_list"]:
+            untagged_vlan = interface["untagged_vlan"]
+            if untagged_vlan:
+                vlans[int(untagged_vlan["id"])] = untagged_vlan
+            for vlan in interface["tagged_vlans"]:
+                vlans[int(vlan["id"])] = vlan
+
+        # GraphQL returns IDs as strings, the REST API as integers
+        return [
+            pynetbox.core.response.Record(
+                {
+                    **vlan,
+                    "id": vlan_id,
+                    "url": f"{self.nb.base_url}/ipam/vlans/{vlan_id}/",
+                },
+                self.nb,
+                self.nb.ipam.vlans,
+            )
+            for vlan_id, vlan in vlans.items()
+        ]
+
+    def _get_device_vlans_rest(self, device: Any) -> List[Any]:
+        """Get VLANs associated with a device with two REST requests."""
+        # Collect the VLAN IDs referenced by the device interfaces
+        interfaces = self.nb.dcim.interfaces.filter(
+            device_id=device.id, fields=INTERFACE_VLAN_FIELDS
+        )
+        vlan_ids = set()
+
+        for interface in interfaces:
+            untagged_vlan = interface.untagged_vlan
+            tagged_vlans = interface.tagged_vlans
+            if untagged_vlan:
+                vlan_ids.add(untagged_vlan.id)
+            if tagged_vlans:
+                vlan_ids.update(vlan.id for vlan in tagged_vlans)
+
+        if not vlan_ids:
+            return []
+
+        # Fetch the VLANs in a few chunked requests instead of one per
+        # interface, keeping the query string of each request bounded
+        sorted_ids = sorted(vlan_ids)
+        vlans = {}
+        for start in range(0, len(sorted_ids), NETBOX_FILTER_CHUNK_SIZE):
+            end = start + NETBOX_FILTER_CHUNK_SIZE
+            for vlan in self.nb.ipam.vlans.filter(id=sorted_ids[start:end]):
+                vlans[vlan.id] = vlan
+        return list(vlans.values())
+
+    def fetch_all_device_info(
+        self, devices: Iterable[Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get loopbacks, OOB IP and VLANs for several devices concurrently.
+
+        Returns:
+            Dictionary mapping device IDs to dictionaries with the keys
+            "loopbacks", "oob_ip" and "vlans"
+        """
+        fetchers = {
+            "loopbacks": lambda device: list(self.get_device_loopbacks(device)),
+            "oob_ip": self.get_device_oob_ip,
+            "vlans": self.get_device_vlans,
+        }
+        device_info: Dict[int, Dict[str, Any]] = {}
+
+        with ThreadPoolExecutor(max_workers=NETBOX_MAX_WORKERS) as executor:
+            futures = {
+                (device.id, key): executor.submit(fetch, device)
+                for device in devices
+                for key, fetch in fetchers.items()
+            }
+            for (device_id, key), future in futures.items():
+                device_info.setdefault(device_id, {})[key] = future.result()
+
+        return device_info
+
+    def _flush_task_output(self) -> None:
+        """Send buffered task output to Redis. The caller holds the lock."""
+        if self._task_output_pending:
+            try:
+                self._task_output_pipe.execute()
+            finally:
+                self._task_output_pending = 0
+
     def push_task_output(self, task_id: str, line: str) -> None:
-        """Push task output to Redis stream."""
-        if self.redis:
+        """Push task output to Redis stream.
+
+        Lines are buffered and sent in batches. The buffer is flushed when a
+        push brings it to TASK_OUTPUT_BUFFER_SIZE lines, or when its oldest
+        line is TASK_OUTPUT_FLUSH_INTERVAL seconds old at the time of a push;
+        there is no background timer. Callers must call flush_task_output()
+        or finish_task_output() to deliver trailing lines.
+        """
+        if self._redis_available():
             try:
-                self.redis.xadd(task_id, {"type": "stdout", "content": line})
+                with self._task_output_lock:
+                    self._task_output_pipe.xadd(
+                        task_id, {"type": "stdout", "content": line}
+                    )
+                    self._task_output_pending += 1
+                    if self._task_output_pending == 1:
+                        self._task_output_started = time.monotonic()
+                    if (
+                        self._task_output_pending >= TASK_OUTPUT_BUFFER_SIZE
+                        or time.monotonic() - self._task_output_started
+                        >= TASK_OUTPUT_FLUSH_INTERVAL
+                    ):
+                        self._flush_task_output()
             except Exception as e:
                 logger.error(f"Error pushing task output: {e}")
 
+    def flush_task_output(self) -> None:
+        """Flush buffered task output to Redis stream."""
+        if self._redis_available():
+            try:
+                with self._task_output_lock:
+                    self._flush_task_output()
+            except Exception as e:
+                logger.error(f"Error flushing task output: {e}")
+
     def finish_task_output(self, task_id: str, rc: int = 0) -> None:
         """Finish task output in Redis stream."""
-        if self.redis:
+        if self._redis_available():
             try:
-                self.redis.xadd(task_id, {"type": "rc", "content": str(rc)})
-                self.redis.xadd(task_id, {"type": "action", "content": "quit"})
+                with self._task_output_lock:
+                    self._task_output_pipe.xadd(
+                        task_id, {"type": "rc", "content": str(rc)}
+                    )
+                    self._task_output_pipe.xadd(
+                        task_id, {"type": "action", "content": "quit"}
+                    )
+                    self._task_output_pending += 2
+                    self._flush_task_output()
             except Exception as e:
                 logger.error(f"Error finishing task output: {e}")
 
@@ -140,7 +427,7 @@ class NetBoxClient:
         self, task_id: str, timeout: int = 300, enable_play_recap: bool = False
     ) -> int:
         """Fetch task output from Redis stream."""
-        if not self.redis:
+        if not self._redis_available():
             return 0
 
         rc = 0
@@ -150,20 +437,24 @@ class NetBoxClient:
         while time.time() < stoptime:
             try:
                 data = self.redis.xread(
-                    {str(task_id): last_id}, count=1, block=(timeout * 1000)
+                    {str(task_id): last_id},
+                    count=TASK_OUTPUT_READ_COUNT,
+                    block=(timeout * 1000),
                 )
                 if data:
                     stoptime = time.time() + timeout
                     messages = data[0]
+                    processed_ids = []
+                    finished = False
                     for message_id, message in messages[1]:
-                        last_id = message_id.decode()
-                        message_type = message[b"type"].decode()
-                        message_content = message[b"content"].decode()
+                        last_id = message_id
+                        processed_ids.append(message_id)
+                        message_type = message["type"]
+                        message_content = message["content"]
 
                         logger.debug(
                             f"Processing message {last_id} of type {message_type}"
                         )
-                        self.redis.xdel(str(task_id), last_id)
 
                         if message_type == "stdout":
                             print(message_content, end="")
@@ -175,7 +466,13 @@ class NetBoxClient:
                         elif message_type == "rc":
                             rc = int(message_content)
                         elif message_type == "action" and message_content == "quit":
-                            return rc
+                            finished = True
+                            break
+
+                    # Delete all processed messages of this batch at once
+                    self.redis.xdel(str(task_id), *processed_ids)
+                    if finished:
+                        return rc
             except Exception as e:
                 logger.error(f"Error fetching task output: {e}")
                 break
@@ -183,5 +480,23 @@ class NetBoxClient:
         return rc
 
 
-# Global NetBox client instance
-netbox_client = NetBoxClient()
+# Global NetBox client instance, created on first use
+_netbox_client: Optional[NetBoxClient] = None
+_netbox_client_lock = threading.Lock()
+
+
+def get_netbox_client() -> NetBoxClient:
+    """Get the global NetBox client, creating it on first use."""
+    global _netbox_client
+    if _netbox_client is None:
+        with _netbox_client_lock:
+            if _netbox_client is None:
+                _netbox_client = NetBoxClient()
+    return _netbox_client
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the legacy ``netbox_client`` module attribute lazily."""
+    if name == "netbox_client":
+        return get_netbox_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,25 +2,30 @@
 
 """NetBox compatibility functions for SONiC Manager."""
 
-from typing import Any, List, Optional
-from .netbox_client import netbox_client
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .netbox_client import get_netbox_client
 
 
 def get_nb_device_query_list_sonic() -> List[dict]:
     """Get NetBox device query list for SONiC devices."""
-    return netbox_client.get_nb_device_query_list_sonic()
+    return get_netbox_client().get_nb_device_query_list_sonic()
 
 
-def get_device_loopbacks(device: Any) -> List[Any]:
+def get_device_loopbacks(device: Any, limit: int = 0) -> Iterator[Any]:
     """Get loopback interfaces for a device."""
-    return netbox_client.get_device_loopbacks(device)
+    return get_netbox_client().get_device_loopbacks(device, limit)
 
 
 def get_device_oob_ip(device: Any) -> Optional[str]:
     """Get out-of-band IP address for a device."""
-    return netbox_client.get_device_oob_ip(device)
+    return get_netbox_client().get_device_oob_ip(device)
 
 
 def get_device_vlans(device: Any) -> List[Any]:
     """Get VLANs associated with a device."""
-    return netbox_client.get_device_vlans(device)
+    return get_netbox_client().get_device_vlans(device)
+
+
+def fetch_all_device_info(devices: Iterable[Any]) -> Dict[int, Dict[str, Any]]:
+    """Get loopbacks, OOB IP and VLANs for several devices concurrently."""
+    return get_netbox_client().fetch_all_device_info(devices)
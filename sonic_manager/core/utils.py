@@ -3,12 +3,17 @@
 """Utility functions for SONiC Manager."""
 
 from typing import Callable, Iterable, TypeVar
-from .netbox_client import netbox_client
+from .netbox_client import get_netbox_client
 
 T = TypeVar("T")
 
 
-def first(iterable: Iterable[T], condition: Callable[[T], bool] = lambda x: True) -> T:
+def _always_true(x: object) -> bool:
+    """Default condition for `first`, matching every item."""
+    return True
+
+
+def first(iterable: Iterable[T], condition: Callable[[T], bool] = _always_true) -> T:
     """
     Returns the first item in the `iterable` that satisfies the `condition`.
 
@@ -24,6 +29,8 @@ def first(iterable: Iterable[T], condition: Callable[[T], bool] = lambda x: True
     ...
     StopIteration
     """
+    if condition is _always_true:
+        return next(iter(iterable))
     return next(x for x in iterable if condition(x))
 
 
@@ -34,21 +41,27 @@ class Utils:
     @property
     def nb(self):
         """NetBox client."""
-        return netbox_client.nb
+        return get_netbox_client().nb
 
     def push_task_output(self, task_id: str, line: str) -> None:
-        """Push task output."""
-        netbox_client.push_task_output(task_id, line)
+        """Push task output, buffered until flushed or finished."""
+        get_netbox_client().push_task_output(task_id, line)
+
+    def flush_task_output(self) -> None:
+        """Flush buffered task output."""
+        get_netbox_client().flush_task_output()
 
     def finish_task_output(self, task_id: str, rc: int = 0) -> None:
         """Finish task output."""
-        netbox_client.finish_task_output(task_id, rc)
+        get_netbox_client().finish_task_output(task_id, rc)
 
     def fetch_task_output(
         self, task_id: str, timeout: int = 300, enable_play_recap: bool = False
     ) -> int:
         """Fetch task output."""
-        return netbox_client.fetch_task_output(task_id, timeout, enable_play_recap)
+        return get_netbox_client().fetch_task_output(
+            task_id, timeout, enable_play_recap
+        )
 
 
 # Global utils instance for compatibility
@@ -43,13 +43,14 @@ def natural_sort_key(port_name):
     return int(match.group(1)) if match else 0
 
 
-def generate_sonic_config(device, hwsku, device_as_mapping=None):
+def generate_sonic_config(device, hwsku, device_as_mapping=None, device_info=None):
     """Generate minimal SONiC config.json for a device.
 
     Args:
         device: NetBox device object
         hwsku: Hardware SKU name
         device_as_mapping: Dict mapping device IDs to pre-calculated AS numbers for spine/superspine groups
+        device_info: Dict with pre-fetched "loopbacks", "oob_ip" and "vlans" for the device, as returned by fetch_all_device_info
 
     Returns:
         dict: Minimal SONiC configuration dictionary
@@ -65,14 +66,16 @@ def generate_sonic_config(device, hwsku, device_as_mapping=None):
         device, portchannel_info
     )
 
-    # Get OOB IP for management interface
-    oob_ip_result = get_device_oob_ip(device)
-
-    # Get VLAN configuration from NetBox
-    vlan_info = get_device_vlans(device)
-
-    # Get Loopback configuration from NetBox
-    loopback_info = get_device_loopbacks(device)
+    # Get OOB IP, VLAN and Loopback configuration from NetBox unless pre-fetched
+    if device_info is None:
+        device_info = {
+            "oob_ip": get_device_oob_ip(device),
+            "vlans": get_device_vlans(device),
+            "loopbacks": list(get_device_loopbacks(device)),
+        }
+    oob_ip_result = device_info["oob_ip"]
+    vlan_info = device_info["vlans"]
+    loopback_info = device_info["loopbacks"]
 
     # Get breakout port configuration from NetBox
     breakout_info = detect_breakout_ports(device)
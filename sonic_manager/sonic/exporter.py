@@ -104,7 +104,7 @@ def save_config_to_netbox(device, sonic_config, return_diff=False):
         return (False, None) if return_diff else False
 
 
-def export_config_to_file(device, sonic_config):
+def export_config_to_file(device, sonic_config, export_dir=None):
     """Export SONiC configuration to local file with diff checking.
 
     Only writes to file if configuration has changed compared to existing file.
@@ -112,13 +112,14 @@ def export_config_to_file(device, sonic_config):
     Args:
         device: NetBox device object
         sonic_config: SONiC configuration dictionary
+        export_dir (str, optional): Directory to export to. Defaults to SONIC_EXPORT_DIR.
 
     Returns:
         bool: True if config was written (changed), False if no changes
     """
     try:
         # Get configuration from settings
-        export_dir = config.SONIC_EXPORT_DIR
+        export_dir = export_dir or config.SONIC_EXPORT_DIR
         prefix = config.SONIC_EXPORT_PREFIX
         suffix = getattr(config, "SONIC_EXPORT_SUFFIX", ".json")
         identifier_type = getattr(config, "SONIC_EXPORT_IDENTIFIER", "hostname")
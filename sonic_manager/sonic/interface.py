@@ -3,6 +3,7 @@
 """Interface conversion and port detection functions for SONiC configuration."""
 
 import copy
+import functools
 import os
 import re
 from loguru import logger
@@ -334,6 +335,37 @@ def convert_sonic_interface_to_alias(
         return f"Eth{module}/{physical_port}"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_port_config_files():
+    """Index the port configuration files in PORT_CONFIG_PATH by HWSKU name.
+
+    Returns:
+        dict: Mapping of HWSKU name to the path of its .ini file
+    """
+    try:
+        with os.scandir(PORT_CONFIG_PATH) as entries:
+            return {
+                entry.name[: -len(".ini")]: entry.path
+                for entry in entries
+                if entry.name.endswith(".ini")
+            }
+    except OSError as e:
+        logger.warning(f"Could not read port config directory {PORT_CONFIG_PATH}: {e}")
+        return {}
+
+
+def get_port_config_path(hwsku):
+    """Get the port configuration file path for a given HWSKU.
+
+    Args:
+        hwsku: Hardware SKU name (e.g., 'Accton-AS5835-54T')
+
+    Returns:
+        str: Path to the port configuration file, or None if there is none
+    """
+    return _get_port_config_files().get(hwsku)
+
+
 def get_port_config(hwsku):
     """Get port configuration for a given HWSKU. Uses caching to avoid repeated file reads.
 
@@ -353,9 +385,10 @@ def get_port_config(hwsku):
         return copy.deepcopy(_port_config_cache[hwsku])
 
     port_config = {}
-    config_path = f"{PORT_CONFIG_PATH}/{hwsku}.ini"
+    config_path = get_port_config_path(hwsku)
 
-    if not os.path.exists(config_path):
+    if config_path is None:
+        config_path = f"{PORT_CONFIG_PATH}/{hwsku}.ini"
         logger.error(f"Port config file not found: {config_path}")
         # Cache empty config to avoid repeated file system checks
         _port_config_cache[hwsku] = port_config
@@ -401,6 +434,7 @@ def clear_port_config_cache():
     """Clear the port configuration cache. Should be called at the start of sync_sonic."""
     global _port_config_cache
     _port_config_cache = {}
+    _get_port_config_files.cache_clear()
     logger.debug("Cleared port configuration cache")
 
 
@@ -5,7 +5,10 @@
 from loguru import logger
 
 from ..core.utils import utils
-from ..core.netbox_compatibility import get_nb_device_query_list_sonic
+from ..core.netbox_compatibility import (
+    fetch_all_device_info,
+    get_nb_device_query_list_sonic,
+)
 from .bgp import calculate_minimum_as_for_group
 from .connections import find_interconnected_devices
 from .config_generator import generate_sonic_config, clear_all_caches
@@ -14,13 +17,14 @@ from .exporter import save_config_to_netbox, export_config_to_file
 from .cache import clear_interface_cache, get_interface_cache_stats
 
 
-def sync_sonic(device_name=None, task_id=None, show_diff=True):
+def sync_sonic(device_name=None, task_id=None, show_diff=True, export_dir=None):
     """Sync SONiC configurations for eligible devices.
 
     Args:
         device_name (str, optional): Name of specific device to sync. If None, sync all eligible devices.
         task_id (str, optional): Task ID for output logging.
         show_diff (bool, optional): Whether to show diffs when changes are detected. Defaults to True.
+        export_dir (str, optional): Directory to export config files to. Defaults to SONIC_EXPORT_DIR.
 
     Returns:
         dict: Dictionary with device names as keys and their SONiC configs as values
@@ -98,9 +102,9 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
                 f"Assigned AS {min_as} to {len(group)} devices in spine/superspine group"
             )
 
-    # Generate SONIC configuration for each device
+    # Get HWSKU of each device from sonic_parameters custom field
+    device_hwskus = []
     for device in devices:
-        # Get HWSKU from sonic_parameters custom field, default to None
         hwsku = None
         if (
             hasattr(device, "custom_fields")
@@ -115,59 +119,77 @@ def sync_sonic(device_name=None, task_id=None, show_diff=True):
             logger.debug(f"Skipping device {device.name}: no HWSKU configured")
             continue
 
-        logger.debug(f"Processing device: {device.name} with HWSKU: {hwsku}")
-
-        # Output current device being processed if task_id is available
-        if task_id:
-            utils.push_task_output(task_id, f"Processing device: {device.name}\n")
+        device_hwskus.append((device, hwsku))
 
-        # Validate that HWSKU is supported
-        if hwsku not in SUPPORTED_HWSKUS:
-            logger.warning(
-                f"Device {device.name} has unsupported HWSKU: {hwsku}. Supported HWSKUs: {', '.join(SUPPORTED_HWSKUS)}"
-            )
-            continue
+    # Fetch per-device NetBox data concurrently, only for the devices that
+    # get a configuration generated
+    all_device_info = fetch_all_device_info(
+        [device for device, hwsku in device_hwskus if hwsku in SUPPORTED_HWSKUS]
+    )
 
-        # Generate SONIC configuration based on device HWSKU
-        sonic_config = generate_sonic_config(device, hwsku, device_as_mapping)
-
-        # Store configuration in the dictionary
-        device_configs[device.name] = sonic_config
+    # Generate SONIC configuration for each device
+    try:
+        for device, hwsku in device_hwskus:
+            logger.debug(f"Processing device: {device.name} with HWSKU: {hwsku}")
+
+            # Output current device being processed if task_id is available
+            if task_id:
+                utils.push_task_output(task_id, f"Processing device: {device.name}\n")
+                utils.flush_task_output()
+
+            # Validate that HWSKU is supported
+            if hwsku not in SUPPORTED_HWSKUS:
+                logger.warning(
+                    f"Device {device.name} has unsupported HWSKU: {hwsku}. Supported HWSKUs: {', '.join(SUPPORTED_HWSKUS)}"
+                )
+                continue
 
-        # Save the generated configuration to NetBox config context (only if changed)
-        if show_diff:
-            netbox_changed, diff_output = save_config_to_netbox(
-                device, sonic_config, return_diff=True
+            # Generate SONIC configuration based on device HWSKU
+            sonic_config = generate_sonic_config(
+                device, hwsku, device_as_mapping, all_device_info.get(device.id)
             )
 
-            # Output diff to task if available and there are changes
-            if task_id and netbox_changed and diff_output:
-                utils.push_task_output(task_id, f"\n{'='*60}\n")
-                utils.push_task_output(
-                    task_id, f"Configuration diff for {device.name}:\n"
-                )
-                utils.push_task_output(task_id, f"{'='*60}\n")
-                utils.push_task_output(task_id, f"{diff_output}\n")
-                utils.push_task_output(task_id, f"{'='*60}\n\n")
-            elif task_id and netbox_changed and not diff_output:
-                # First-time configuration (no diff available)
-                utils.push_task_output(
-                    task_id, f"First-time configuration created for {device.name}\n"
+            # Store configuration in the dictionary
+            device_configs[device.name] = sonic_config
+
+            # Save the generated configuration to NetBox config context (only if changed)
+            if show_diff:
+                netbox_changed, diff_output = save_config_to_netbox(
+                    device, sonic_config, return_diff=True
                 )
-        else:
-            netbox_changed = save_config_to_netbox(device, sonic_config)
 
-        # Export the generated configuration to local file (only if changed)
-        file_changed = export_config_to_file(device, sonic_config)
+                # Output diff to task if available and there are changes
+                if task_id and netbox_changed and diff_output:
+                    utils.push_task_output(task_id, f"\n{'='*60}\n")
+                    utils.push_task_output(
+                        task_id, f"Configuration diff for {device.name}:\n"
+                    )
+                    utils.push_task_output(task_id, f"{'='*60}\n")
+                    utils.push_task_output(task_id, f"{diff_output}\n")
+                    utils.push_task_output(task_id, f"{'='*60}\n\n")
+                elif task_id and netbox_changed and not diff_output:
+                    # First-time configuration (no diff available)
+                    utils.push_task_output(
+                        task_id, f"First-time configuration created for {device.name}\n"
+                    )
+            else:
+                netbox_changed = save_config_to_netbox(device, sonic_config)
 
-        if netbox_changed or file_changed:
-            logger.info(f"Configuration updated for device {device.name}")
-        else:
-            logger.info(f"No configuration changes for device {device.name}")
+            # Export the generated configuration to local file (only if changed)
+            file_changed = export_config_to_file(device, sonic_config, export_dir)
 
-        logger.info(
-            f"Generated SONiC config for device {device.name} with {len(sonic_config['PORT'])} ports"
-        )
+            if netbox_changed or file_changed:
+                logger.info(f"Configuration updated for device {device.name}")
+            else:
+                logger.info(f"No configuration changes for device {device.name}")
+
+            logger.info(
+                f"Generated SONiC config for device {device.name} with {len(sonic_config['PORT'])} ports"
+            )
+    finally:
+        # Deliver buffered task output even if generating a config failed
+        if task_id:
+            utils.flush_task_output()
 
     logger.info(f"Generated SONiC configurations for {len(device_configs)} devices")
 
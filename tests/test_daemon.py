@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the request/reply protocol of the daemon mode."""
+
+import os
+import stat
+import threading
+
+import click
+import pytest
+
+from sonic_manager.cli import daemon
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    server = daemon.create_server(str(tmp_path / "sonic-manager.sock"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_forward_command(socket_path):
+    reply = daemon.forward_command(["config-info"], socket_path)
+
+    assert reply is not None
+    assert reply["rc"] == 0
+    assert "SONiC Manager Configuration:" in reply["stdout"]
+
+
+def test_forward_unknown_command(socket_path):
+    reply = daemon.forward_command(["no-such-command"], socket_path)
+
+    assert reply is not None
+    assert reply["rc"] == 2
+    assert "No such command" in reply["stderr"]
+
+
+def test_forward_rejected_on_environment_change(socket_path, monkeypatch):
+    monkeypatch.setenv("NETBOX_URL", "https://netbox.example.com")
+
+    assert daemon.forward_command(["config-info"], socket_path) is None
+
+
+def test_forward_without_daemon(tmp_path):
+    socket_path = str(tmp_path / "sonic-manager.sock")
+
+    assert daemon.forward_command(["config-info"], socket_path) is None
+
+
+def test_socket_is_owner_only(socket_path):
+    mode = stat.S_IMODE(os.stat(socket_path).st_mode)
+
+    assert mode == 0o600
+
+
+def test_refuses_second_daemon(socket_path):
+    with pytest.raises(click.ClickException):
+        daemon.create_server(socket_path)